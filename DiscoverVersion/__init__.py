@@ -22,7 +22,6 @@
 # SOFTWARE.
 #
 
-from .version import __version__
 from .discovery import (
     get_version,
     get_version_from_env,
@@ -33,3 +32,32 @@ from .discovery import (
     CannotDiscoverVersion,
     VERSION_OVERRIDE_ENV,
 )
+from .discovery import _build_systems as _discovery_build_systems
+
+# Build systems (e.g. flit_core) load this file under their own module name
+# and read `__version__` directly from the module dictionary, bypassing the
+# lazy lookup below, so we need to resolve the version eagerly in that case.
+if __name__.split(".")[0] in _discovery_build_systems:
+    from .version import __version__
+
+del _discovery_build_systems
+
+
+def __getattr__(name):
+    # `__version__` is resolved lazily so that importing DiscoverVersion does
+    # not run version discovery (and potentially git) at import time.
+    if name == "__version__":
+        try:
+            from .version import __version__
+        except CannotDiscoverVersion as exc:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}: {exc}"
+            ) from exc
+
+        globals()["__version__"] = __version__
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {"__version__"})
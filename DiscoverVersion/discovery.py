@@ -22,10 +22,10 @@
 # SOFTWARE.
 #
 
+# Only `os` is imported at module level to keep `import DiscoverVersion`
+# cheap; `shutil`, `subprocess` and `pathlib` are imported on demand by the
+# functions that need them.
 import os
-import shutil
-import subprocess
-from pathlib import Path
 
 _toplevel_package = __name__.split(".")[0]
 _build_systems = ["flit_core"]
@@ -54,6 +54,10 @@ def get_version_from_git(dirname):
     """
     Discover version from git repository.
     """
+    import shutil
+    import subprocess
+    from pathlib import Path
+
     if shutil.which("git") is None:
         raise CannotDiscoverVersion("git executable does not exist.")
 
@@ -209,6 +213,8 @@ def write_version_file(version, output_path, template=None):
         Template string for the version file. Use {version} as placeholder.
         If None, writes a Python file with __version__ variable.
     """
+    from pathlib import Path
+
     output_path = Path(output_path)
 
     if template is None:
@@ -238,6 +244,8 @@ def write_plain_version_file(version, output_path):
     output_path : str or Path
         Path to the output file.
     """
+    from pathlib import Path
+
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w") as f:
@@ -27,7 +27,9 @@ Tests version discovery functionality.
 """
 
 import os
+import shutil
 import subprocess
+import sys
 from tempfile import TemporaryDirectory
 
 from DiscoverVersion import __version__, get_version
@@ -75,3 +77,116 @@ def test_version_from_git_submodule():
             use_importlib=False,
             use_pkginfo=False,
         ).startswith(_current_version)
+
+
+_source_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run_python(code, *args, cwd=None, pythonpath=_source_dir, **environ):
+    """
+    Run `code` in a fresh interpreter and return its stderr. Environment
+    variables passed as None are removed from the environment.
+    """
+    env = os.environ.copy()
+    env.update(environ)
+    env = {key: value for key, value in env.items() if value is not None}
+    env["PYTHONPATH"] = os.pathsep.join(
+        [pythonpath] + ([env["PYTHONPATH"]] if "PYTHONPATH" in env else [])
+    )
+    r = subprocess.run(
+        [sys.executable, *args, "-c", code],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert r.returncode == 0, r.stderr.decode()
+    return r.stderr.decode()
+
+
+def _imported_modules(code, **environ):
+    """Return the modules imported by `code` and their cumulative import time."""
+    modules = {}
+    for line in _run_python(code, "-X", "importtime", **environ).splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        modules[name.strip()] = int(cumulative_us)
+    return modules
+
+
+def test_import_time_budget():
+    baseline = _imported_modules("pass")
+    imported = _imported_modules("import DiscoverVersion")
+    new_modules = set(imported) - set(baseline)
+
+    # Heavy modules are only needed for git discovery and must be deferred
+    for name in ["subprocess", "shutil", "pathlib"]:
+        assert name not in new_modules, f"{name} imported at import time"
+    # Only the package itself and its discovery module should be loaded
+    assert new_modules <= {"DiscoverVersion", "DiscoverVersion.discovery"}, new_modules
+    # Generous budget (in microseconds) to avoid flaky failures on slow runners
+    assert imported["DiscoverVersion"] < 50000
+
+
+def test_lazy_version_from_env():
+    import DiscoverVersion
+
+    assert "__version__" in dir(DiscoverVersion)
+
+    # Resolving the version through the environment fast path must not pull
+    # in the modules needed for git discovery
+    imported = _imported_modules(
+        "import sys, DiscoverVersion; "
+        "assert DiscoverVersion.__version__ == '1.2.3'; "
+        "assert 'subprocess' not in sys.modules",
+        DISCOVER_VERSION="1.2.3",
+    )
+    assert "DiscoverVersion.version" in imported
+
+
+def test_version_for_build_system():
+    # Mimic how flit_core extracts the version: load `__init__.py` under a
+    # dummy module name and look up `__version__` in the module dictionary
+    init_file = os.path.join(_source_dir, "DiscoverVersion", "__init__.py")
+    _run_python(
+        f"""
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+spec = spec_from_file_location("flit_core.dummy.import1", {init_file!r})
+m = module_from_spec(spec)
+sys.modules[spec.name] = m
+spec.loader.exec_module(m)
+assert m.__dict__.get("__version__") == "1.2.3", m.__dict__.get("__version__")
+assert "subprocess" not in sys.modules
+""",
+        DISCOVER_VERSION="1.2.3",
+    )
+
+
+def test_undiscoverable_version():
+    # Outside of a git checkout and without any other source of version
+    # information, `__version__` must behave like a missing attribute
+    with TemporaryDirectory() as tmpdir:
+        shutil.copytree(
+            os.path.join(_source_dir, "DiscoverVersion"),
+            os.path.join(tmpdir, "DiscoverVersion"),
+        )
+        code = """
+import importlib.metadata
+import inspect
+
+
+def version(name):
+    raise importlib.metadata.PackageNotFoundError(name)
+
+
+importlib.metadata.version = version
+
+import DiscoverVersion
+
+assert getattr(DiscoverVersion, "__version__", None) is None
+assert not hasattr(DiscoverVersion, "__version__")
+inspect.getmembers(DiscoverVersion)
+"""
+        _run_python(code, cwd=tmpdir, pythonpath=tmpdir, DISCOVER_VERSION=None)